@@ -30,6 +30,10 @@ class AttrDict(dict):
     def __missing__(self, key):
         return AttrDict()
 
+    def __reduce__(self):
+        # __getattr__ would otherwise hand pickle an empty AttrDict for __getstate__/__setstate__
+        return AttrDict, (dict(self),)
+
     __setattr__ = __setitem__
 
 
@@ -59,6 +63,13 @@ class Config:
     def __bool__(self):
         return self.config != {}
 
+    def __getstate__(self):
+        # defined here so pickle does not go through __getattr__
+        return self.__dict__
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
     def __getattr__(self, attr):
         return self.config[attr]
 
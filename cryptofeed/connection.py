@@ -41,6 +41,7 @@ class AsyncConnection:
         self.kwargs = kwargs
         self.conn = None
         self.session = None
+        self.shared_session = False
         self.raw_cb = None
         self.__sleep = sleep
         self.__delay = delay
@@ -61,6 +62,7 @@ class AsyncConnection:
         try:
             if self.session is None or self.session.closed:
                 self.session = aiohttp.ClientSession()
+                self.shared_session = False
             if self.conn_type == "ws":
                 if self.raw_cb:
                     await self.raw_cb(None, time.time(), self.uuid, connect=self.address)
@@ -72,7 +74,7 @@ class AsyncConnection:
             if self.conn:
                 await self.conn.close()
                 self.conn = None
-            if self.session:
+            if self.session and not self.shared_session:
                 await self.session.close()
                 self.session = None
 
@@ -85,7 +87,7 @@ class AsyncConnection:
         if self.conn:
             await self.conn.close()
             self.conn = None
-        if self.session:
+        if self.session and not self.shared_session:
             await self.session.close()
             self.session = None
 
@@ -121,6 +123,14 @@ class AsyncConnection:
     def set_raw_data_callback(self, raw_data_cb: Callable):
         self.raw_cb = raw_data_cb
 
+    def set_session(self, session: aiohttp.ClientSession):
+        """
+        Use a session shared with other connections. The connection will not close it,
+        that is left to the owner of the session.
+        """
+        self.session = session
+        self.shared_session = True
+
     @property
     def open(self):
         if self.conn:
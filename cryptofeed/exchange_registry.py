@@ -0,0 +1,71 @@
+'''
+Copyright (C) 2017-2021  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import importlib
+from types import MappingProxyType
+
+from cryptofeed.defines import (BINANCE, BINANCE_DELIVERY, BINANCE_FUTURES, BINANCE_US, BITCOINCOM, BITFINEX, BITFLYER,
+                                BITMAX, BITMEX, BITSTAMP, BITTREX, BLOCKCHAIN, BYBIT, COINBASE, COINGECKO,
+                                DERIBIT, EXX, FTX, FTX_US, GATEIO, GEMINI, HITBTC, HUOBI, HUOBI_DM, HUOBI_SWAP,
+                                KRAKEN, KRAKEN_FUTURES, OKCOIN, OKEX, POLONIEX, PROBIT, UPBIT, WHALE_ALERT)
+
+
+# Maps string name to the module and class name of the feed, for use with config.
+# Feed modules are only imported when a feed is requested by name
+_EXCHANGES = MappingProxyType({
+    BINANCE: ('cryptofeed.exchange.binance', 'Binance'),
+    BINANCE_US: ('cryptofeed.exchange.binance_us', 'BinanceUS'),
+    BINANCE_FUTURES: ('cryptofeed.exchange.binance_futures', 'BinanceFutures'),
+    BINANCE_DELIVERY: ('cryptofeed.exchange.binance_delivery', 'BinanceDelivery'),
+    BITCOINCOM: ('cryptofeed.exchange.bitcoincom', 'BitcoinCom'),
+    BITFINEX: ('cryptofeed.exchange.bitfinex', 'Bitfinex'),
+    BITFLYER: ('cryptofeed.exchange.bitflyer', 'Bitflyer'),
+    BITMAX: ('cryptofeed.exchange.bitmax', 'Bitmax'),
+    BITMEX: ('cryptofeed.exchange.bitmex', 'Bitmex'),
+    BITSTAMP: ('cryptofeed.exchange.bitstamp', 'Bitstamp'),
+    BITTREX: ('cryptofeed.exchange.bittrex', 'Bittrex'),
+    BLOCKCHAIN: ('cryptofeed.exchange.blockchain', 'Blockchain'),
+    BYBIT: ('cryptofeed.exchange.bybit', 'Bybit'),
+    COINBASE: ('cryptofeed.exchange.coinbase', 'Coinbase'),
+    COINGECKO: ('cryptofeed.provider.coingecko', 'Coingecko'),
+    DERIBIT: ('cryptofeed.exchange.deribit', 'Deribit'),
+    EXX: ('cryptofeed.exchange.exx', 'EXX'),
+    FTX: ('cryptofeed.exchange.ftx', 'FTX'),
+    FTX_US: ('cryptofeed.exchange.ftx_us', 'FTXUS'),
+    GEMINI: ('cryptofeed.exchange.gemini', 'Gemini'),
+    HITBTC: ('cryptofeed.exchange.hitbtc', 'HitBTC'),
+    HUOBI_DM: ('cryptofeed.exchange.huobi_dm', 'HuobiDM'),
+    HUOBI_SWAP: ('cryptofeed.exchange.huobi_swap', 'HuobiSwap'),
+    HUOBI: ('cryptofeed.exchange.huobi', 'Huobi'),
+    KRAKEN_FUTURES: ('cryptofeed.exchange.kraken_futures', 'KrakenFutures'),
+    KRAKEN: ('cryptofeed.exchange.kraken', 'Kraken'),
+    OKCOIN: ('cryptofeed.exchange.okcoin', 'OKCoin'),
+    OKEX: ('cryptofeed.exchange.okex', 'OKEx'),
+    POLONIEX: ('cryptofeed.exchange.poloniex', 'Poloniex'),
+    UPBIT: ('cryptofeed.exchange.upbit', 'Upbit'),
+    GATEIO: ('cryptofeed.exchange.gateio', 'Gateio'),
+    PROBIT: ('cryptofeed.exchange.probit', 'Probit'),
+    WHALE_ALERT: ('cryptofeed.provider.whale_alert', 'WhaleAlert')
+})
+_EXCHANGE_CLASSES = {}
+# Maps class name to string name, for resolving feed classes by class name
+_CLASS_NAMES = {class_name: feed for feed, (_, class_name) in _EXCHANGES.items()}
+_EXCHANGE_NAMES = str(list(_EXCHANGES.keys()))
+_INVALID_FEED_ERR = f'Invalid feed specified. Valid feeds are {_EXCHANGE_NAMES}'
+
+
+def _exchange_class(name: str):
+    """
+    Return the feed class for the string name, importing its module on first use
+    """
+    cls = _EXCHANGE_CLASSES.get(name)
+    if cls is None:
+        entry = _EXCHANGES.get(name)
+        if entry is None:
+            raise ValueError(_INVALID_FEED_ERR)
+        module, class_name = entry
+        cls = _EXCHANGE_CLASSES[name] = getattr(importlib.import_module(module), class_name)
+    return cls
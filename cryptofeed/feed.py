@@ -268,14 +268,16 @@ class Feed:
         raise NotImplementedError
 
     async def shutdown(self):
-        LOG.info('%s: feed shutdown starting...', self.id)
+        # per feed shutdown logs are debug only, the feedhandler logs a summary for all feeds
+        LOG.debug('%s: feed shutdown starting...', self.id)
         for callbacks in self.callbacks.values():
             for callback in callbacks:
                 if hasattr(callback, 'stop'):
-                    cb_name = callback.__class__.__name__ if hasattr(callback, '__class__') else callback.__name__
-                    LOG.info('%s: stopping backend %s', self.id, cb_name)
+                    if LOG.isEnabledFor(logging.DEBUG):
+                        cb_name = callback.__class__.__name__ if hasattr(callback, '__class__') else callback.__name__
+                        LOG.debug('%s: stopping backend %s', self.id, cb_name)
                     await callback.stop()
-        LOG.info('%s: feed shutdown completed', self.id)
+        LOG.debug('%s: feed shutdown completed', self.id)
 
     def start(self, loop):
         for callbacks in self.callbacks.values():
@@ -6,9 +6,13 @@ associated with this software.
 '''
 import asyncio
 import logging
+import multiprocessing
 import signal
 from signal import SIGABRT, SIGINT, SIGTERM
+import socket
 import sys
+import threading
+import warnings
 
 try:
     # unix / macos only
@@ -23,80 +27,126 @@ from socket import error as socket_error
 from time import time
 from typing import List, Optional
 
+import aiohttp
 from yapic import json
 
 from websockets import ConnectionClosed
 from websockets.exceptions import InvalidStatusCode
 
 from cryptofeed.config import Config
-from cryptofeed.defines import (BINANCE, BINANCE_DELIVERY, BINANCE_FUTURES, BINANCE_US, BITCOINCOM, BITFINEX, BITFLYER,
-                                BITMAX, BITMEX, BITSTAMP, BITTREX, BLOCKCHAIN, BYBIT, COINBASE, COINGECKO,
-                                DERIBIT, FTX_US, GATEIO, GEMINI, HITBTC, HUOBI, HUOBI_DM, HUOBI_SWAP,
-                                KRAKEN, KRAKEN_FUTURES, OKCOIN, OKEX, POLONIEX, PROBIT, UPBIT, WHALE_ALERT)
-from cryptofeed.defines import EXX as EXX_str
-from cryptofeed.defines import FTX as FTX_str
-from cryptofeed.defines import L2_BOOK
+from cryptofeed.defines import HUOBI, HUOBI_DM, L2_BOOK, OKCOIN, OKEX
 from cryptofeed.exceptions import ExhaustedRetries
-from cryptofeed.exchanges import *
-from cryptofeed.providers import *
+from cryptofeed.exchange_registry import _CLASS_NAMES, _EXCHANGE_NAMES, _EXCHANGES, _exchange_class  # noqa: F401
 from cryptofeed.log import get_logger
 from cryptofeed.nbbo import NBBO
+from cryptofeed.standards import load_exchange_symbol_mapping
+from cryptofeed.symbols import gen_symbols
 
 
 LOG = logging.getLogger('feedhandler')
+_IS_WINDOWS = sys.platform.startswith('win')
 
 
-# Maps string name to class name for use with config
-_EXCHANGES = {
-    BINANCE: Binance,
-    BINANCE_US: BinanceUS,
-    BINANCE_FUTURES: BinanceFutures,
-    BINANCE_DELIVERY: BinanceDelivery,
-    BITCOINCOM: BitcoinCom,
-    BITFINEX: Bitfinex,
-    BITFLYER: Bitflyer,
-    BITMAX: Bitmax,
-    BITMEX: Bitmex,
-    BITSTAMP: Bitstamp,
-    BITTREX: Bittrex,
-    BLOCKCHAIN: Blockchain,
-    BYBIT: Bybit,
-    COINBASE: Coinbase,
-    COINGECKO: Coingecko,
-    DERIBIT: Deribit,
-    EXX_str: EXX,
-    FTX_str: FTX,
-    FTX_US: FTXUS,
-    GEMINI: Gemini,
-    HITBTC: HitBTC,
-    HUOBI_DM: HuobiDM,
-    HUOBI_SWAP: HuobiSwap,
-    HUOBI: Huobi,
-    KRAKEN_FUTURES: KrakenFutures,
-    KRAKEN: Kraken,
-    OKCOIN: OKCoin,
-    OKEX: OKEx,
-    POLONIEX: Poloniex,
-    UPBIT: Upbit,
-    GATEIO: Gateio,
-    PROBIT: Probit,
-    WHALE_ALERT: WhaleAlert
-}
+def __getattr__(name):
+    # feed classes are no longer imported into this module, resolve them on demand
+    # for code that still imports them from here (e.g. from cryptofeed.feedhandler import Coinbase)
+    feed = _CLASS_NAMES.get(name)
+    if feed is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _exchange_class(feed)
+
+
+def _current_loop():
+    """
+    Return the running loop, or else the (open) loop set for the current thread, or None
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    with warnings.catch_warnings():
+        # get_event_loop() warns when there is no current loop on newer versions of python
+        warnings.simplefilter('ignore', DeprecationWarning)
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            return None
+    return None if loop.is_closed() else loop
+
+
+def _loop_is_set():
+    """
+    Whether a loop is running or an open loop was set for the current thread. Unlike
+    get_event_loop() this never creates a loop, asyncio has no public API for it
+    """
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        pass
+    local = getattr(asyncio.get_event_loop_policy(), '_local', None)
+    loop = getattr(local, '_loop', None)
+    return loop is not None and not loop.is_closed()
+
+
+def _drain_wakeup_fd(rsock):
+    try:
+        while rsock.recv(4096):
+            pass
+    except (BlockingIOError, InterruptedError):
+        pass
 
 
 def setup_signal_handlers(loop):
     """
     This must be run from the loop in the main thread
+
+    The handlers are installed with signal.signal rather than loop.add_signal_handler
+    so a stop signal interrupts the loop directly instead of being queued as a callback.
+    Any handler previously installed for these signals (including with
+    loop.add_signal_handler) is replaced. Only the first stop signal is acted on,
+    later ones are ignored so they cannot interrupt the shutdown of the feeds.
+
+    Returns the wakeup fd state to pass to remove_signal_wakeup_fd once the loop
+    is done, or None on windows
     """
+    stopping = False
+
     def handle_stop_signals(*args):
+        nonlocal stopping
+        if stopping:
+            return
+        stopping = True
         raise SystemExit
-    if sys.platform.startswith('win'):
-        # NOTE: asyncio loop.add_signal_handler() not supported on windows
-        for sig in SIGNALS:
-            signal.signal(sig, handle_stop_signals)
-    else:
-        for sig in SIGNALS:
-            loop.add_signal_handler(sig, handle_stop_signals)
+
+    for sig in SIGNALS:
+        signal.signal(sig, handle_stop_signals)
+
+    if _IS_WINDOWS:
+        # NOTE: asyncio loop.add_reader() not supported on windows
+        return None
+
+    # the wakeup fd wakes the selector as soon as a signal is delivered
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    wsock.setblocking(False)
+    loop.add_reader(rsock.fileno(), _drain_wakeup_fd, rsock)
+    previous = signal.set_wakeup_fd(wsock.fileno(), warn_on_full_buffer=False)
+    return rsock, wsock, previous
+
+
+def remove_signal_wakeup_fd(loop, wakeup):
+    """
+    Undo the wakeup fd set up by setup_signal_handlers: restore the previous
+    wakeup fd and close the sockets. Must be run from the main thread
+    """
+    if wakeup is None:
+        return
+    rsock, wsock, previous = wakeup
+    loop.remove_reader(rsock.fileno())
+    signal.set_wakeup_fd(previous)
+    rsock.close()
+    wsock.close()
 
 
 class FeedHandler:
@@ -128,12 +178,22 @@ class FeedHandler:
         if exception_ignore is not None and not isinstance(exception_ignore, list):
             raise ValueError("exception_ignore must be a list of Exceptions or None")
         self.exceptions = exception_ignore
+        self.loop = None
+        self._http_session = None
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._signal_wakeup = None
+        self._start_tasks = set()
 
         get_logger('feedhandler', self.config.log.filename, self.config.log.level)
         if self.config.log_msg:
             LOG.info(self.config.log_msg)
 
-        if self.config.uvloop:
+        # uvloop is used whenever it is importable, unless explicitly disabled in the config.
+        # Replacing the policy would drop a loop the application already set, so the feeds then run on that loop
+        if self.config.uvloop is not False and _loop_is_set():
+            LOG.info('FH: uvloop not initialized, an event loop is already set')
+        elif self.config.uvloop is not False:
             try:
                 import uvloop
                 asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -155,10 +215,7 @@ class FeedHandler:
             newly instantiated object
         """
         if isinstance(feed, str):
-            if feed in _EXCHANGES:
-                self.feeds.append((_EXCHANGES[feed](config=self.config, **kwargs), timeout))
-            else:
-                raise ValueError("Invalid feed specified")
+            self.feeds.append((_exchange_class(feed)(config=self.config, **kwargs), timeout))
         else:
             self.feeds.append((feed, timeout))
 
@@ -169,7 +226,7 @@ class FeedHandler:
         feed: str or class
             the feed (exchange) to add to the handler
         loop: None, or EventLoop
-            the loop on which to add the tasks
+            the loop on which to add the tasks. Defaults to the loop created by run
         timeout: int
             number of seconds without a message before the feed is considered
             to be timed out. The connection will be closed, and if retries
@@ -178,21 +235,28 @@ class FeedHandler:
         kwargs: dict
             if a string is used for the feed, kwargs will be passed to the
             newly instantiated object
-        """
-        self.add_feed(feed, timeout=timeout, *kwargs)
 
+        Returns an asyncio task (or a concurrent.futures.Future when called from a thread
+        other than the one running the loop) that completes once the feed's backends are
+        started and its connection handlers are scheduled. Several of these can be
+        gathered to add feeds in parallel.
+        """
         if loop is None:
-            loop = asyncio.get_event_loop()
+            loop = self.loop
+        if loop is None:
+            raise ValueError("add_feed_running requires a loop: pass one, or call it after run")
 
+        self.add_feed(feed, timeout=timeout, **kwargs)
         f, timeout = self.feeds[-1]
 
-        for conn, sub, handler in f.connect():
-            if self.raw_message_capture:
-                conn.set_raw_data_callback(self.raw_message_capture)
-                self.raw_message_capture.set_header(conn.uuid, json.dumps(f._feed_config))
-            self.timeout[conn.uuid] = timeout
-            feed.start(loop)
-            loop.create_task(self._connect(conn, sub, handler))
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            return loop.create_task(self._start_feed(f, timeout))
+        return asyncio.run_coroutine_threadsafe(self._start_feed(f, timeout), loop)
 
     def add_nbbo(self, feeds, symbols, callback, timeout=120):
         """
@@ -210,45 +274,72 @@ class FeedHandler:
         for feed in feeds:
             self.add_feed(feed(channels=[L2_BOOK], symbols=symbols, callbacks={L2_BOOK: cb}), timeout=timeout)
 
-    def run(self, start_loop: bool = True, install_signal_handlers: bool = True, exception_handler=None):
+    def run(self, start_loop: bool = True, install_signal_handlers: bool = True, exception_handler=None, workers: int = 1):
         """
         start_loop: bool, default True
-            if false, will not start the event loop.
+            if false, will not start the event loop: the feeds are scheduled to start on it,
+            and they start once the caller runs the loop. This also works when run is called
+            from a coroutine on the already running loop
         install_signal_handlers: bool, default True
             if True, will install the signal handlers on the event loop. This
             can only be done from the main thread's loop, so if running cryptofeed on
             a child thread, this must be set to false, and setup_signal_handlers must
-            be called from the main/parent thread's event loop
+            be called from the main/parent thread's event loop. See also run_in_thread
         exception_handler: asyncio exception handler function pointer
             a custom exception handler for asyncio
+        workers: int, default 1
+            if greater than 1, the feeds are split round-robin across this many worker processes,
+            each running its own event loop, and run blocks until the workers exit. The feeds, their
+            callbacks and the exception handler must be picklable, the calling script must be guarded
+            by if __name__ == '__main__', and start_loop is ignored. An NBBO cannot be split across workers
         """
         if len(self.feeds) == 0:
-            txt = f'FH: No feed specified. Please specify at least one feed among {list(_EXCHANGES.keys())}'
+            txt = f'FH: No feed specified. Please specify at least one feed among {_EXCHANGE_NAMES}'
             LOG.critical(txt)
             raise ValueError(txt)
 
-        loop = asyncio.get_event_loop()
+        if workers > 1:
+            self._run_workers(workers, install_signal_handlers, exception_handler)
+            return
+
+        if self.loop is None:
+            self.loop = _current_loop()
+        if self.loop is None:
+            # new_event_loop() goes through the event loop policy, so this is a uvloop
+            # loop when uvloop is enabled, even when run from a child thread
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+        loop = self.loop
         # Good to enable when debugging or without code change: export PYTHONASYNCIODEBUG=1)
         # loop.set_debug(True)
 
         if install_signal_handlers:
-            setup_signal_handlers(loop)
-
-        for feed, timeout in self.feeds:
-            for conn, sub, handler in feed.connect():
-                if self.raw_message_capture:
-                    self.raw_message_capture.set_header(conn.uuid, json.dumps(feed._feed_config))
-                    conn.set_raw_data_callback(self.raw_message_capture)
-                loop.create_task(self._connect(conn, sub, handler))
-                self.timeout[conn.uuid] = timeout
-                feed.start(loop)
+            self._signal_wakeup = setup_signal_handlers(loop)
 
         if not start_loop:
+            # the loop may already be running (run called from a coroutine), so it cannot be run here
+            for feed, timeout in self.feeds:
+                task = loop.create_task(self._start_feed(feed, timeout), name=f'start_feed_{feed.id}')
+                self._start_tasks.add(task)
+                task.add_done_callback(self._start_feed_done)
             return
 
+        self._run_forever(loop, exception_handler, start_feeds=True)
+
+    def _start_feed_done(self, task):
+        self._start_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            LOG.error('FH: %s failed', task.get_name(), exc_info=task.exception())
+
+    def _run_forever(self, loop, exception_handler, start_feeds=False):
+        startup = None
         try:
             if exception_handler:
                 loop.set_exception_handler(exception_handler)
+            if start_feeds:
+                # inside the try so a stop signal received while the feeds start still shuts them down
+                startup = asyncio.gather(*[self._start_feed(feed, timeout) for feed, timeout in self.feeds])
+                loop.run_until_complete(startup)
             loop.run_forever()
         except SystemExit:
             LOG.info('FH: System Exit received - shutting down')
@@ -257,56 +348,209 @@ class FeedHandler:
         finally:
             self.stop(loop=loop)
             self.close(loop=loop)
+            if startup is not None and startup.done() and not startup.cancelled():
+                # an interrupted or failed startup was handled above, mark it as retrieved
+                startup.exception()
+
+        LOG.info('FH: leaving run()')
+
+    def run_in_thread(self, exception_handler=None) -> threading.Thread:
+        """
+        Run the feedhandler on a new event loop (uvloop when enabled) in a daemon thread.
+        No signal handlers are involved, stop it with shutdown_from_main_thread, otherwise
+        the backends are not flushed when the process exits.
+
+        exception_handler: asyncio exception handler function pointer
+            a custom exception handler for asyncio
+
+        Returns the started thread
+        """
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._thread_main, args=(exception_handler,), name='feedhandler', daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def shutdown_from_main_thread(self, timeout: Optional[float] = None):
+        """
+        Stop a feedhandler started with run_in_thread, and wait up to timeout seconds
+        (forever if None) for its thread to shut down the feeds and close the loop
+        """
+        self._stop_event.set()
+        loop = self.loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(loop.stop)
+            except RuntimeError:
+                # the loop was already closed
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _thread_main(self, exception_handler):
+        self.run(start_loop=False, install_signal_handlers=False)
+        loop = self.loop
+        if self._stop_event.is_set():
+            # shutdown was requested while the feeds were being set up, before the loop was known
+            loop.stop()
+        self._run_forever(loop, exception_handler)
+
+    def _run_workers(self, workers: int, install_signal_handlers: bool, exception_handler):
+        """
+        Run the feeds in worker processes and wait for the workers to exit
+        """
+        for feed, _ in self.feeds:
+            if any(isinstance(cb, NBBO) for cb in feed.callbacks[L2_BOOK]):
+                raise ValueError("NBBO feeds share their state and cannot be split across worker processes")
+
+        handler_kwargs = {
+            'retries': self.retries - 1 if self.retries > 0 else -1,
+            'timeout_interval': self.timeout_interval,
+            'log_messages_on_error': self.log_messages_on_error,
+            'raw_message_capture': self.raw_message_capture,
+            'config': self.config.config,
+            'exception_ignore': self.exceptions
+        }
+        # the symbol mappings live in module globals that the feeds filled in when they were created in this
+        # process. Unpickled feeds do not run __init__ again, so the workers are handed the mappings instead
+        symbol_mappings = {feed.id: gen_symbols(feed.id, key_id=feed.key_id) for feed, _ in self.feeds}
+        workers = min(workers, len(self.feeds))
+        ctx = multiprocessing.get_context('spawn')
+        processes = []
+        for i in range(workers):
+            process = ctx.Process(target=_run_worker, args=(self.feeds[i::workers], symbol_mappings, handler_kwargs, exception_handler), name=f'cryptofeed-worker-{i}')
+            process.start()
+            processes.append(process)
+        LOG.info('FH: started %d worker processes', len(processes))
+
+        previous_handlers = {}
+        if install_signal_handlers:
+            def forward_stop_signal(*args):
+                for process in processes:
+                    if process.is_alive():
+                        process.terminate()
+
+            # the workers install their own handlers. Stop signals sent to this process are forwarded to
+            # them as SIGTERM, SIGINT included: a worker that also got the SIGINT from the terminal
+            # ignores the repeated signal
+            for sig in SIGNALS:
+                previous_handlers[sig] = signal.signal(sig, forward_stop_signal)
+
+        try:
+            for process in processes:
+                process.join()
+        finally:
+            for sig, handler in previous_handlers.items():
+                signal.signal(sig, handler)
 
         LOG.info('FH: leaving run()')
 
     def stop(self, loop=None):
         """Shutdown the Feed backends asynchronously."""
         if not loop:
-            loop = asyncio.get_event_loop()
+            loop = self.loop
 
         LOG.info('FH: flag retries=0 to stop the tasks running the connection handlers')
         self.retries = 0
 
-        LOG.info('FH: create the tasks to properly shutdown the backends (to flush the local cache)')
-        shutdown_tasks = []
-        for feed, _ in self.feeds:
-            task = loop.create_task(feed.shutdown())
-            try:
-                task.set_name(f'shutdown_feed_{feed.id}')
-            except AttributeError:
-                # set_name only in 3.8+
-                pass
-            shutdown_tasks.append(task)
         if self.raw_message_capture:
             self.raw_message_capture.stop()
 
-        LOG.info('FH: wait %s backend tasks until termination', len(shutdown_tasks))
-        loop.run_until_complete(asyncio.gather(*shutdown_tasks))
+        loop.run_until_complete(self._shutdown_feeds())
+
+    async def _shutdown_feeds(self):
+        """
+        Shutdown the feeds, with at most shutdown_concurrency (from the config) running at once
+        so the backends are not flooded with writes while they flush their local cache
+        """
+        semaphore = asyncio.Semaphore(self.config.shutdown_concurrency or 8)
+        timeout = self.config.shutdown_timeout or None
+
+        # a failing shutdown is logged here so it can neither cancel the other
+        # shutdowns (TaskGroup) nor keep the loop from being closed
+        async def shutdown(feed):
+            async with semaphore:
+                try:
+                    await asyncio.wait_for(feed.shutdown(), timeout)
+                except asyncio.TimeoutError:
+                    LOG.error('%s: feed shutdown did not complete within %s seconds', feed.id, timeout)
+                except Exception:
+                    LOG.error('%s: encountered an exception during feed shutdown', feed.id, exc_info=True)
+
+        if LOG.isEnabledFor(logging.INFO):
+            LOG.info('FH: created %d shutdown tasks to flush the backends (ids=%s)', len(self.feeds), [feed.id for feed, _ in self.feeds])
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                for feed, _ in self.feeds:
+                    tg.create_task(shutdown(feed), name=f'shutdown_feed_{feed.id}')
+        else:
+            loop = asyncio.get_running_loop()
+            shutdown_tasks = [loop.create_task(shutdown(feed), name=f'shutdown_feed_{feed.id}') for feed, _ in self.feeds]
+            await asyncio.gather(*shutdown_tasks)
 
     def close(self, loop=None):
-        """Stop the asynchronous generators and close the event loop."""
+        """Cancel the pending tasks, stop the asynchronous generators and close the event loop."""
         if not loop:
-            loop = asyncio.get_event_loop()
+            loop = self.loop
 
-        LOG.info('FH: stop the AsyncIO loop')
-        loop.stop()
-        LOG.info('FH: run the AsyncIO event loop one last time')
-        loop.run_forever()
+        LOG.info('FH: drain the AsyncIO event loop')
+        loop.run_until_complete(self._drain())
 
-        pending = asyncio.all_tasks(loop=loop)
-        LOG.info('FH: cancel the %s pending tasks', len(pending))
-        for task in pending:
-            task.cancel()
+        if self._signal_wakeup:
+            remove_signal_wakeup_fd(loop, self._signal_wakeup)
+            self._signal_wakeup = None
 
-        LOG.info('FH: run the pending tasks until complete')
-        loop.run_until_complete(asyncio.gather(*pending, loop=loop, return_exceptions=True))
+        LOG.info('FH: close the AsyncIO loop')
+        loop.close()
+        if loop is self.loop:
+            # a later run (or run_in_thread) starts on a new loop
+            self.loop = None
+
+    async def _drain(self):
+        """
+        Cancel and wait on every other task of the loop, then close the shared HTTP session
+        and the asynchronous generators, all in a single run of the loop
+        """
+        # all_tasks() only holds tasks that are still alive, not every task ever scheduled.
+        # It also has to be used here (rather than tracking the tasks the feedhandler creates)
+        # since the backends and some feeds start tasks of their own
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        if pending:
+            LOG.info('FH: cancel the %s pending tasks', len(pending))
+            for task in pending:
+                task.cancel()
+
+            LOG.info('FH: run the pending tasks until complete')
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if self._http_session:
+            LOG.info('FH: close the shared HTTP session')
+            await self._http_session.close()
+            self._http_session = None
 
         LOG.info('FH: shutdown asynchronous generators')
-        loop.run_until_complete(loop.shutdown_asyncgens())
+        await asyncio.get_running_loop().shutdown_asyncgens()
 
-        LOG.info('FH: close the AsyncIO loop')
-        loop.close()
+    async def _start_feed(self, feed, timeout):
+        """
+        Start the backends of the feed and create the tasks running its connection handlers
+        """
+        loop = asyncio.get_running_loop()
+        feed.start(loop)
+
+        connections = feed.connect()
+        if self._http_session is None and any(conn.conn_type == 'https' for conn, _, _ in connections):
+            # one connection pool (and DNS cache) for the HTTP polling connections of every feed
+            connector = aiohttp.TCPConnector(limit=0, limit_per_host=64, ttl_dns_cache=300, enable_cleanup_closed=True)
+            self._http_session = aiohttp.ClientSession(connector=connector)
+
+        for conn, sub, handler in connections:
+            if conn.conn_type == 'https':
+                conn.set_session(self._http_session)
+            if self.raw_message_capture:
+                self.raw_message_capture.set_header(conn.uuid, json.dumps(feed._feed_config))
+                conn.set_raw_data_callback(self.raw_message_capture)
+            self.timeout[conn.uuid] = timeout
+            loop.create_task(self._connect(conn, sub, handler))
 
     async def _watch(self, connection):
         if self.timeout[connection.uuid] == -1:
@@ -363,7 +607,7 @@ class FeedHandler:
                     await asyncio.sleep(delay)
                     retries += 1
                     delay *= 2
-            except Exception:
+            except Exception as e:
                 if self.exceptions:
                     for ex in self.exceptions:
                         if isinstance(e, ex):
@@ -399,3 +643,16 @@ class FeedHandler:
             # exception will be logged with traceback when connection handler
             # retries the connection
             raise
+
+
+def _run_worker(feeds, symbol_mappings, handler_kwargs, exception_handler):
+    """
+    Entry point of the worker processes started by FeedHandler.run(workers=N)
+    """
+    for exchange, mapping in symbol_mappings.items():
+        load_exchange_symbol_mapping(exchange, mapping=mapping)
+
+    fh = FeedHandler(**handler_kwargs)
+    for feed, timeout in feeds:
+        fh.add_feed(feed, timeout=timeout)
+    fh.run(exception_handler=exception_handler)
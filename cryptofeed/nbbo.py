@@ -21,10 +21,10 @@ class NBBO(Callback):
         super(NBBO, self).__init__(callback)
 
     def _update(self, feed, symbol, book):
-        bid = Decimal(list(book[BID].keys())[-1])
+        bid = Decimal(book[BID].keys()[-1])
         size = book[BID][bid]
         self.bids[symbol][feed] = {'price': bid, 'size': size}
-        ask = Decimal(list(book[ASK].keys())[0])
+        ask = Decimal(book[ASK].keys()[0])
         size = book[ASK][ask]
         self.asks[symbol][feed] = {'price': ask, 'size': size}
 
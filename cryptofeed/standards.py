@@ -30,8 +30,14 @@ _std_trading_symbols = collections.defaultdict(dict)
 _exchange_to_std = {}
 
 
-def load_exchange_symbol_mapping(exchange: str, key_id=None):
-    mapping = gen_symbols(exchange, key_id=key_id)
+def load_exchange_symbol_mapping(exchange: str, key_id=None, mapping=None):
+    """
+    mapping: dict, or None
+        normalized to exchange symbol mapping, as returned by gen_symbols.
+        Retrieved from the exchange when not provided
+    """
+    if mapping is None:
+        mapping = gen_symbols(exchange, key_id=key_id)
     for std, exch in mapping.items():
         _exchange_to_std[exch] = std
         _std_trading_symbols[std][exchange] = exch
@@ -34,7 +34,9 @@ def add_new_feed():
 
 
 def main():
-    loop = asyncio.get_event_loop()
+    # the feedhandler runs its feeds on the loop set for this thread
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     f.add_feed(Coinbase(symbols=['BTC-USD'], channels=[TRADES], callbacks={TRADES: trade}))
     f.run(start_loop=False)
 
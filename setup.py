@@ -48,12 +48,11 @@ setup(
     url="https://github.com/bmoscon/cryptofeed",
     packages=find_packages(exclude=['tests*']),
     cmdclass={'test': Test},
-    python_requires='>=3.7',
+    python_requires='>=3.8',
     classifiers=[
         "Intended Audience :: Developers",
         "Development Status :: 4 - Beta",
         "Programming Language :: Python :: 3 :: Only",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Framework :: AsyncIO",
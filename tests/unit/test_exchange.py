@@ -12,7 +12,7 @@ import pytest
 
 from cryptofeed.util.async_file import playback
 from cryptofeed.defines import BINANCE, BINANCE_DELIVERY, BITCOINCOM, BITFINEX, EXX, BINANCE_FUTURES, BINANCE_US, BITFLYER, BITMAX, BITMEX, BITSTAMP, BITTREX, BLOCKCHAIN, COINBASE, COINGECKO, DERIBIT, FTX_US, FTX, GATEIO, GEMINI, HITBTC, HUOBI, HUOBI_DM, HUOBI_SWAP, KRAKEN, KRAKEN_FUTURES, OKCOIN, OKEX, OPEN_INTEREST, POLONIEX, PROBIT, TICKER, TRADES, L2_BOOK, BYBIT, UPBIT, WHALE_ALERT
-from cryptofeed.feedhandler import _EXCHANGES
+from cryptofeed.exchange_registry import _EXCHANGES, _exchange_class
 
 
 # Some exchanges discard messages so we cant use a normal in == out comparison for testing purposes
@@ -72,7 +72,7 @@ def test_exchange_playback(exchange):
     dir = os.path.dirname(os.path.realpath(__file__))
     for pcap in glob.glob(f"{dir}/../../sample_data/{exchange}-*.0"):
         
-        feed = _EXCHANGES[exchange]
+        feed = _exchange_class(exchange)
         with open(pcap, 'r') as fp:
             header = fp.readline()
             sub = json.loads(header.split(": ", 1)[1])
@@ -6,12 +6,12 @@ associated with this software.
 '''
 import os
 
-from cryptofeed.feedhandler import _EXCHANGES
+from cryptofeed.exchange_registry import _EXCHANGES, _exchange_class
 
 
 def test_exchanges_fh():
     """
-    Ensure all exchanges are in feedhandler's string to class mapping
+    Ensure all exchanges are in the registry's string to class mapping
     """
     path = os.path.dirname(os.path.abspath(__file__))
     files = os.listdir(f"{path}/../../cryptofeed/exchange")
@@ -19,3 +19,21 @@ def test_exchanges_fh():
     files = [f for f in files if '__' not in f]
     files = [f[:-3].upper() for f in files]  # Drop extension .py and uppercase
     assert(sorted(files) == sorted(_EXCHANGES))
+
+
+def test_exchanges_fh_lazy_import():
+    """
+    Ensure each entry in the registry resolves to the feed class with the matching id
+    """
+    for name in _EXCHANGES:
+        assert _exchange_class(name).id == name
+
+
+def test_feedhandler_class_lookup():
+    """
+    Ensure feed classes can still be imported from the feedhandler module
+    """
+    from cryptofeed.feedhandler import Coinbase
+    from cryptofeed.exchange.coinbase import Coinbase as CoinbaseExchange
+
+    assert Coinbase is CoinbaseExchange
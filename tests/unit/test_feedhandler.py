@@ -0,0 +1,415 @@
+'''
+Copyright (C) 2017-2021  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+import concurrent.futures
+import multiprocessing
+import queue
+import os
+import signal
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from cryptofeed import FeedHandler
+from cryptofeed.connection import AsyncConnection
+from cryptofeed.defines import COINBASE, L2_BOOK
+from cryptofeed.exchange_registry import _EXCHANGE_CLASSES
+from cryptofeed.feedhandler import SIGNALS
+from cryptofeed.standards import symbol_exchange_to_std
+from cryptofeed import symbols
+
+
+class FakeFeed:
+    """
+    Minimal stand in for a Feed, its connections are never connected. It reports on start and then stops its loop
+    """
+    id = 'FAKE'
+
+    def __init__(self, queue=None, name=None, config=None, connections=(), **kwargs):
+        self.queue = queue
+        self.connections = list(connections)
+        self.name = name
+        self.kwargs = kwargs
+        self.key_id = None
+        self.callbacks = {L2_BOOK: []}
+        self._feed_config = {}
+        self.started = False
+        self.stopped = False
+
+    def connect(self):
+        return [(conn, None, None) for conn in self.connections]
+
+    def start(self, loop):
+        self.started = True
+        if self.queue is not None:
+            self.queue.put((self.name, symbol_exchange_to_std('fake-btcusd')))
+            loop.call_later(0.1, self._exit)
+
+    def _exit(self):
+        raise SystemExit
+
+    async def shutdown(self):
+        self.stopped = True
+
+
+class FailingStartFeed(FakeFeed):
+    def start(self, loop):
+        raise RuntimeError('start failed')
+
+
+class InterruptedStartFeed(FakeFeed):
+    def start(self, loop):
+        self.started = True
+        signal.raise_signal(signal.SIGINT)
+
+
+class RunningFeed(FakeFeed):
+    """
+    Reports on start and on shutdown, and keeps its loop running until it is stopped
+    """
+    def start(self, loop):
+        self.queue.put((self.name, 'started'))
+
+    async def shutdown(self):
+        self.queue.put((self.name, 'stopped'))
+
+
+class FailingShutdownFeed(FakeFeed):
+    async def shutdown(self):
+        raise RuntimeError('shutdown failed')
+
+
+class SlowShutdownFeed(FakeFeed):
+    async def shutdown(self):
+        await asyncio.sleep(0.1)
+        self.stopped = True
+
+
+class StuckShutdownFeed(FakeFeed):
+    async def shutdown(self):
+        await asyncio.sleep(3600)
+
+
+class CountingShutdownFeed(FakeFeed):
+    """
+    Records in counts how many feeds are shutting down at the same time
+    """
+    def __init__(self, counts, **kwargs):
+        super().__init__(**kwargs)
+        self.counts = counts
+
+    async def shutdown(self):
+        self.counts['running'] += 1
+        self.counts['peak'] = max(self.counts['peak'], self.counts['running'])
+        await asyncio.sleep(0.01)
+        self.counts['running'] -= 1
+        self.stopped = True
+
+
+def config(tmp_path):
+    return {'uvloop': False, 'log': {'filename': str(tmp_path / 'feedhandler.log'), 'level': 'WARNING'}}
+
+
+def test_run_workers_symbol_mapping(tmp_path, monkeypatch):
+    """
+    Ensure feeds running in worker processes can normalize symbols
+    """
+    monkeypatch.setitem(symbols._symbols_retrieval_cache, FakeFeed.id, {'BTC-USD': 'fake-btcusd'})
+    queue = multiprocessing.get_context('spawn').Queue()
+
+    fh = FeedHandler(config=config(tmp_path))
+    for name in ('a', 'b', 'c'):
+        fh.add_feed(FakeFeed(queue=queue, name=name))
+    fh.run(install_signal_handlers=False, workers=2)
+
+    results = sorted(queue.get(timeout=30) for _ in range(3))
+    assert results == [('a', 'BTC-USD'), ('b', 'BTC-USD'), ('c', 'BTC-USD')]
+
+
+def test_add_feed_running_requires_loop(tmp_path):
+    fh = FeedHandler(config=config(tmp_path))
+    with pytest.raises(ValueError):
+        fh.add_feed_running(FakeFeed())
+    assert fh.feeds == []
+
+
+def test_add_feed_running_kwargs_and_task(tmp_path, monkeypatch):
+    """
+    Ensure kwargs reach the feed created from a string name, and the returned task completes once the feed is started
+    """
+    monkeypatch.setitem(_EXCHANGE_CLASSES, COINBASE, FakeFeed)
+    fh = FeedHandler(config=config(tmp_path))
+    loop = asyncio.new_event_loop()
+
+    async def add():
+        task = fh.add_feed_running(COINBASE, loop=loop, name='running', symbols=['BTC-USD'])
+        assert isinstance(task, asyncio.Task)
+        await task
+
+    try:
+        loop.run_until_complete(add())
+    finally:
+        loop.close()
+
+    feed, timeout = fh.feeds[-1]
+    assert feed.name == 'running'
+    assert feed.kwargs['symbols'] == ['BTC-USD']
+    assert timeout == 120
+    assert feed.started
+
+
+def test_add_feed_running_from_other_thread(tmp_path):
+    """
+    Ensure a feed added from another thread is started on the loop, through the returned future
+    """
+    fh = FeedHandler(config=config(tmp_path))
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    try:
+        future = fh.add_feed_running(FakeFeed(), loop=loop)
+        assert isinstance(future, concurrent.futures.Future)
+        future.result(timeout=5)
+        assert fh.feeds[-1][0].started
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def test_close_restores_signal_wakeup_fd(tmp_path):
+    """
+    Ensure the wakeup fd installed with the signal handlers is removed when the loop is closed
+    """
+    previous = signal.set_wakeup_fd(-1)
+    try:
+        fh = FeedHandler(config=config(tmp_path))
+        fh.add_feed(FakeFeed(queue=queue.Queue()))
+        fh.run()
+        assert fh.loop is None
+        assert signal.set_wakeup_fd(-1) == -1
+    finally:
+        signal.set_wakeup_fd(previous)
+        for sig in SIGNALS:
+            signal.signal(sig, signal.default_int_handler if sig == signal.SIGINT else signal.SIG_DFL)
+
+
+def test_run_in_thread_twice(tmp_path):
+    """
+    Ensure the feedhandler can be run in a thread again once the previous run has been shut down
+    """
+    fh = FeedHandler(config=config(tmp_path))
+    feed = FakeFeed()
+    fh.add_feed(feed)
+    for _ in range(2):
+        feed.started = feed.stopped = False
+        thread = fh.run_in_thread()
+        fh.shutdown_from_main_thread(timeout=10)
+        assert not thread.is_alive()
+        assert feed.started and feed.stopped
+        assert fh.loop is None
+
+
+def test_run_without_loop_from_running_loop(tmp_path):
+    """
+    Ensure run(start_loop=False) can be called from a coroutine, the feeds starting on the running loop
+    """
+    fh = FeedHandler(config=config(tmp_path))
+    feed = FakeFeed()
+    fh.add_feed(feed)
+
+    async def main():
+        fh.run(start_loop=False, install_signal_handlers=False)
+        assert fh.loop is asyncio.get_running_loop()
+        await asyncio.sleep(0)
+        assert feed.started
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+
+def test_failing_feed_shutdown(tmp_path):
+    """
+    Ensure a feed failing to shut down neither interrupts the other shutdowns nor keeps the loop from being closed
+    """
+    fh = FeedHandler(config=config(tmp_path))
+    slow = SlowShutdownFeed()
+    fh.add_feed(FailingShutdownFeed())
+    fh.add_feed(slow)
+    fh.run(start_loop=False, install_signal_handlers=False)
+    loop = fh.loop
+
+    fh.stop()
+    fh.close()
+    assert slow.stopped
+    assert loop.is_closed()
+
+
+def test_http_session_only_for_https_connections(tmp_path):
+    """
+    Ensure the shared HTTP session is only created for, and given to, the https connections
+    """
+    fh = FeedHandler(config=config(tmp_path))
+    ws = AsyncConnection('wss://example.com', 'ws')
+    https = AsyncConnection('https://example.com', 'https')
+
+    async def start():
+        await fh._start_feed(FakeFeed(connections=[ws]), 120)
+        assert fh._http_session is None
+
+        await fh._start_feed(FakeFeed(connections=[https]), 120)
+        assert fh._http_session is not None
+        assert https.session is fh._http_session and https.shared_session
+        assert ws.session is None
+
+        for task in asyncio.all_tasks() - {asyncio.current_task()}:
+            task.cancel()
+        await fh._http_session.close()
+
+    asyncio.run(start())
+
+
+def test_run_in_thread_exits_without_shutdown(tmp_path):
+    """
+    Ensure the feedhandler thread does not keep the process alive when shutdown_from_main_thread is never called
+    """
+    script = f"""
+import time
+from cryptofeed import FeedHandler
+from tests.unit.test_feedhandler import FakeFeed
+
+fh = FeedHandler(config={{'uvloop': False, 'log': {{'filename': {str(tmp_path / 'feedhandler.log')!r}, 'level': 'WARNING'}}}})
+fh.add_feed(FakeFeed())
+fh.run_in_thread()
+time.sleep(0.5)
+"""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    result = subprocess.run([sys.executable, '-c', script], cwd=root, timeout=30)
+    assert result.returncode == 0
+
+
+def test_uvloop_keeps_application_loop(tmp_path):
+    """
+    Ensure the uvloop policy does not replace a loop the application already set, the feeds run on that loop
+    """
+    config = {'log': {'filename': str(tmp_path / 'feedhandler.log'), 'level': 'WARNING'}}
+    policy = asyncio.get_event_loop_policy()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        fh = FeedHandler(config=config)
+        assert asyncio.get_event_loop_policy() is policy
+        feed = FakeFeed()
+        fh.add_feed(feed)
+        fh.run(start_loop=False, install_signal_handlers=False)
+        assert fh.loop is loop
+        loop.run_until_complete(asyncio.sleep(0))
+        assert feed.started
+    finally:
+        asyncio.set_event_loop_policy(policy)
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def test_stop_signal_during_startup(tmp_path):
+    """
+    Ensure a stop signal received while the feeds start still shuts down the feeds and closes the loop
+    """
+    previous = signal.getsignal(signal.SIGINT)
+    try:
+        fh = FeedHandler(config=config(tmp_path))
+        feed = InterruptedStartFeed()
+        fh.add_feed(feed)
+        fh.run()
+        assert feed.started and feed.stopped
+        assert fh.loop is None
+    finally:
+        for sig in SIGNALS:
+            signal.signal(sig, previous if sig == signal.SIGINT else signal.SIG_DFL)
+
+
+def test_failing_start_is_logged(tmp_path):
+    """
+    Ensure a feed failing to start with run(start_loop=False) is logged rather than left as an unretrieved task exception
+    """
+    fh = FeedHandler(config=config(tmp_path))
+    fh.add_feed(FailingStartFeed())
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        fh.run(start_loop=False, install_signal_handlers=False)
+        loop.run_until_complete(asyncio.sleep(0))
+        assert not fh._start_tasks
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+    assert 'FH: start_feed_FAKE failed' in (tmp_path / 'feedhandler.log').read_text()
+
+
+def test_run_workers_forwards_stop_signals(tmp_path, monkeypatch):
+    """
+    Ensure a SIGINT sent to the parent stops the workers, and the parent's signal handlers are restored afterwards
+    """
+    monkeypatch.setitem(symbols._symbols_retrieval_cache, FakeFeed.id, {'BTC-USD': 'fake-btcusd'})
+    previous = signal.getsignal(signal.SIGINT)
+    queue = multiprocessing.get_context('spawn').Queue()
+
+    def interrupt():
+        for _ in range(2):
+            queue.get(timeout=60)
+        os.kill(os.getpid(), signal.SIGINT)
+
+    fh = FeedHandler(config=config(tmp_path))
+    for name in ('a', 'b'):
+        fh.add_feed(RunningFeed(queue=queue, name=name))
+    thread = threading.Thread(target=interrupt, daemon=True)
+    thread.start()
+    fh.run(workers=2)
+    thread.join()
+
+    assert sorted(queue.get(timeout=30) for _ in range(2)) == [('a', 'stopped'), ('b', 'stopped')]
+    assert signal.getsignal(signal.SIGINT) is previous
+
+
+def test_shutdown_concurrency(tmp_path):
+    """
+    Ensure at most shutdown_concurrency feeds are shut down at the same time
+    """
+    counts = {'running': 0, 'peak': 0}
+    fh = FeedHandler(config={**config(tmp_path), 'shutdown_concurrency': 2})
+    feeds = [CountingShutdownFeed(counts) for _ in range(5)]
+    for feed in feeds:
+        fh.add_feed(feed)
+
+    asyncio.run(fh._shutdown_feeds())
+    assert counts['peak'] == 2
+    assert all(feed.stopped for feed in feeds)
+
+
+def test_shutdown_timeout(tmp_path):
+    """
+    Ensure a feed stuck in its shutdown is logged and given up on after shutdown_timeout seconds
+    """
+    fh = FeedHandler(config={**config(tmp_path), 'shutdown_timeout': 0.2})
+    slow = SlowShutdownFeed()
+    fh.add_feed(StuckShutdownFeed())
+    fh.add_feed(slow)
+
+    loop = asyncio.new_event_loop()
+    try:
+        start = loop.time()
+        loop.run_until_complete(fh._shutdown_feeds())
+        assert loop.time() - start < 5
+    finally:
+        loop.close()
+    assert slow.stopped
+    assert 'FAKE: feed shutdown did not complete within 0.2 seconds' in (tmp_path / 'feedhandler.log').read_text()
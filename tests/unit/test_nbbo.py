@@ -0,0 +1,45 @@
+'''
+Copyright (C) 2017-2021  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+from decimal import Decimal
+
+from sortedcontainers import SortedDict
+
+from cryptofeed.defines import ASK, BID
+from cryptofeed.nbbo import NBBO
+
+
+def book(bids, asks):
+    return {
+        BID: SortedDict({Decimal(price): Decimal(size) for price, size in bids}),
+        ASK: SortedDict({Decimal(price): Decimal(size) for price, size in asks})
+    }
+
+
+def test_nbbo():
+    updates = []
+
+    async def callback(*args):
+        updates.append(args)
+
+    nbbo = NBBO(callback, ['BTC-USD'])
+
+    async def run():
+        await nbbo(feed='A', symbol='BTC-USD', book=book([('99', '1'), ('100', '2')], [('102', '3'), ('103', '1')]), timestamp=1, receipt_timestamp=1)
+        await nbbo(feed='B', symbol='BTC-USD', book=book([('101', '4')], [('104', '5')]), timestamp=2, receipt_timestamp=2)
+        # same best bid and ask as the previous update
+        await nbbo(feed='B', symbol='BTC-USD', book=book([('100', '1'), ('101', '4')], [('104', '5'), ('105', '1')]), timestamp=3, receipt_timestamp=3)
+        # a feed seen for the first time is part of the NBBO
+        await nbbo(feed='C', symbol='BTC-USD', book=book([('98', '1')], [('101.5', '6')]), timestamp=4, receipt_timestamp=4)
+
+    asyncio.run(run())
+
+    assert updates == [
+        ('BTC-USD', Decimal('100'), Decimal('2'), Decimal('102'), Decimal('3'), 'A', 'A'),
+        ('BTC-USD', Decimal('101'), Decimal('4'), Decimal('102'), Decimal('3'), 'B', 'A'),
+        ('BTC-USD', Decimal('101'), Decimal('4'), Decimal('101.5'), Decimal('6'), 'B', 'C'),
+    ]
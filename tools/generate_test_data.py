@@ -8,7 +8,8 @@ import asyncio
 import glob
 import random
 
-from cryptofeed.feedhandler import FeedHandler, _EXCHANGES
+from cryptofeed.exchange_registry import _EXCHANGES, _exchange_class
+from cryptofeed.feedhandler import FeedHandler
 from cryptofeed.defines import BINANCE_FUTURES, BITFINEX, COINGECKO, L2_BOOK, TRADES, TICKER, CANDLES, WHALE_ALERT
 from cryptofeed.util.async_file import AsyncFileCallback
 from check_raw_dump import main as check_dump
@@ -28,9 +29,10 @@ def main():
                 skip.append(e.split("-")[0])
 
     print(f'Generating test data. This will take approximately {(len(_EXCHANGES) - len(set(skip))) * 2} minutes.')
-    for exch_str, exchange in _EXCHANGES.items():
+    for exch_str in _EXCHANGES.keys():
         if exch_str in skip:
             continue
+        exchange = _exchange_class(exch_str)
         print(f"Collecting data for {exch_str}")
         info = exchange.info()
         channels = list(set.intersection(set(info['channels']), set([L2_BOOK, TRADES, TICKER, CANDLES])))